@@ -18,27 +18,251 @@ Author: Claude Code - Security Enhancement
 License: MIT
 """
 
+import base64
+import functools
 import hashlib
 import hmac
 import json
+import os
 import secrets
+import ssl
+import tempfile
+import threading
 import time
 import uuid
-from datetime import datetime, timedelta
+import warnings
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List
 from urllib.parse import urlencode, parse_qs
 
 try:
     import jwt
     from cryptography.fernet import Fernet
     from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 except ImportError:
     print("⚠️  Security dependencies missing. Install with:")
     print("pip install PyJWT cryptography")
     raise
 
+# Optional fast JSON (falls back to stdlib when missing)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# HS256 HMACs go through hashlib's SHA-256. When the interpreter is linked
+# against OpenSSL this uses its accelerated (SHA-NI) implementation; the
+# builtin fallback is several times slower.
+OPENSSL_SHA256 = hashlib.sha256.__name__ == 'openssl_sha256'
+if not OPENSSL_SHA256:
+    warnings.warn(
+        f"hashlib is not using OpenSSL for SHA-256 ({ssl.OPENSSL_VERSION}); "
+        "token signing and verification will be slower",
+        RuntimeWarning
+    )
+
+# Credential files are sealed with AES-256-GCM as nonce || ciphertext. Keys
+# are derived with HKDF from a master key, one subkey per purpose. With the
+# default storage directories the master key is shared from the config
+# directory (~/.perplexity-notion/.master_key); a custom storage directory
+# keeps its own. Per-file key files from older releases (raw AES or base64
+# Fernet) are still used when present.
+NONCE_SIZE = 12
+AES_KEY_SIZE = 32
+MASTER_KEY_NAME = '.master_key'
+DEVICE_KEY_PURPOSE = b'device-id-v1'
+OAUTH_KEY_PURPOSE = b'oauth-tokens-v1'
+
+
+def _master_key_file(storage_dir: Optional[Path]) -> Path:
+    """Default master key location for a manager's storage directory."""
+    if storage_dir is None:
+        return Path.home() / '.perplexity-notion' / MASTER_KEY_NAME
+    return storage_dir / MASTER_KEY_NAME
+
+
+def _read_master_key(path: Path) -> bytes:
+    """Read an existing master key, rejecting files that can't be trusted."""
+    with open(path, 'rb') as f:
+        if os.name == 'posix':
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.getuid():
+                raise PermissionError(f"Master key {path} is not owned by the current user")
+            if st.st_mode & 0o077:
+                raise PermissionError(f"Master key {path} is accessible to other users (expected mode 600)")
+        key = f.read(AES_KEY_SIZE + 1)
+
+    if len(key) != AES_KEY_SIZE:
+        raise ValueError(f"Master key {path} is not a {AES_KEY_SIZE}-byte key")
+    return key
+
+
+def _load_master_key(path: Path) -> bytes:
+    """Read the master key, creating it on first use."""
+    if path.exists():
+        return _read_master_key(path)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write the key to a private temp file and link it into place, so the
+    # key file appears complete; processes starting together settle on
+    # whichever link lands first
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(secrets.token_bytes(AES_KEY_SIZE))
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp, path)
+        except FileExistsError:
+            pass
+    finally:
+        os.unlink(tmp)
+    return _read_master_key(path)
+
+
+def _derive_key(master_key: bytes, purpose: bytes) -> bytes:
+    """Derive the subkey for one credential file."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=AES_KEY_SIZE,
+        salt=None,
+        info=b'perplexity-notion:' + purpose
+    ).derive(master_key)
+
+
+def _master_cipher(path: Path, purpose: bytes) -> '_CredentialCipher':
+    """Cipher for one purpose, keyed from the shared master key."""
+    return _CredentialCipher(_derive_key(_load_master_key(path), purpose))
+
+
+class _CredentialCipher:
+    """Seals and opens credential files with one key, parsed once."""
+
+    def __init__(self, key: bytes):
+        if len(key) == AES_KEY_SIZE:
+            self._aead = AESGCM(key)
+            self._fernet = None
+        else:
+            self._aead = None
+            self._fernet = Fernet(key)
+
+    def seal(self, data: bytes) -> bytes:
+        """Encrypt data for a credential file."""
+        if self._fernet is not None:
+            return self._fernet.encrypt(data)
+        nonce = secrets.token_bytes(NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data, None)
+
+    def unseal(self, blob: bytes) -> bytes:
+        """Decrypt a credential file written by seal()."""
+        if self._fernet is not None:
+            return self._fernet.decrypt(blob)
+        return self._aead.decrypt(blob[:NONCE_SIZE], blob[NONCE_SIZE:], None)
+
+
+_b64encode = base64.urlsafe_b64encode
+
+
+def _new_jti() -> str:
+    """Random 128-bit token ID, base64url without padding (22 chars)."""
+    return _b64encode(secrets.token_bytes(16))[:22].decode('ascii')
+
+
+# jwt.decode arguments, shared instead of rebuilt on every call
+_ALGORITHMS = ('HS256',)
+_VALIDATE_OPTIONS = {'verify_exp': True, 'verify_iat': True, 'verify_nbf': True}
+_REVOKE_OPTIONS = {'verify_exp': False}
+
+# Tokens we mint always carry the same header; encode it once
+_HS256_HEADER = _b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b'=')
+
+
+def _sign_hs256(payload: Dict, keyed_hmac: 'hmac.HMAC') -> str:
+    """
+    Encode and sign an HS256 JWT.
+
+    Produces a valid HS256 token without PyJWT's per-call header handling.
+    It decodes to the same claims as jwt.encode's but is not always
+    byte-identical (orjson leaves non-ASCII claims unescaped). keyed_hmac
+    is an HMAC-SHA256 object that has absorbed the key and nothing else;
+    it is copied, not consumed. Verification still goes through jwt.decode.
+    """
+    body = _dumps(payload)
+    signing_input = _HS256_HEADER + b'.' + _b64encode(body).rstrip(b'=')
+    mac = keyed_hmac.copy()
+    mac.update(signing_input)
+    signature = _b64encode(mac.digest()).rstrip(b'=')
+    return (signing_input + b'.' + signature).decode('ascii')
+
+
+class _AppendLog:
+    """Append-only line log shared by threads, fsynced every N lines and on close."""
+
+    def __init__(self, path: Path, sync_every: int):
+        self.path = path
+        self.sync_every = sync_every
+        self._file = None
+        self._unsynced = 0
+        self._lock = threading.Lock()
+
+    def append(self, line: str):
+        """Append one line, opening the log on first use."""
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+            self._file.write(f"{line}\n")
+            self._file.flush()
+
+            self._unsynced += 1
+            if self._unsynced >= self.sync_every:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def close(self):
+        """Sync and close the log; safe to call more than once."""
+        with self._lock:
+            if self._file is not None:
+                if self._unsynced:
+                    os.fsync(self._file.fileno())
+                    self._unsynced = 0
+                self._file.close()
+                self._file = None
+
+
+def _unverified_claims(token: str) -> Optional[Dict]:
+    """
+    Decode a JWT payload segment without checking its signature.
+
+    Only for cheap pre-filtering; nothing read here may be trusted.
+    Returns None if the token is malformed.
+    """
+    try:
+        segment = token.split('.', 2)[1]
+        claims = _loads(base64.urlsafe_b64decode(segment + '=' * (-len(segment) % 4)))
+    except (IndexError, ValueError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def _same_fingerprint(claimed, current: str) -> bool:
+    """Constant-time comparison of a token's device_fp claim."""
+    return isinstance(claimed, str) and hmac.compare_digest(claimed.encode(), current.encode())
+
 
 class DeviceIdentity:
     """
@@ -48,17 +272,24 @@ class DeviceIdentity:
     but can be revoked if compromised.
     """
 
-    def __init__(self, storage_dir: Path):
+    def __init__(self, storage_dir: Path, master_key_file: Optional[Path] = None):
         """
         Initialize device identity manager.
 
         Args:
             storage_dir: Directory for storing device credentials
+            master_key_file: Master key to derive the device key from
+                (default: .master_key in storage_dir)
         """
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.device_file = storage_dir / 'device_id.enc'
-        self.key_file = storage_dir / '.device_key'
+        self.key_file = storage_dir / '.device_key'  # Legacy per-file key
+        self.master_key_file = master_key_file or _master_key_file(storage_dir)
+
+        # Neither value changes during a process lifetime; computed once
+        self._device_id: Optional[str] = None
+        self._fingerprint: Optional[str] = None
 
     def get_device_id(self) -> str:
         """
@@ -67,62 +298,68 @@ class DeviceIdentity:
         Returns:
             Unique device identifier
         """
-        if self.device_file.exists():
-            return self._load_device_id()
-        else:
-            return self._create_device_id()
+        if self._device_id is None:
+            if self.device_file.exists():
+                self._device_id = self._load_device_id()
+            else:
+                self._device_id = self._create_device_id()
+        return self._device_id
+
+    @functools.cached_property
+    def _cipher(self) -> _CredentialCipher:
+        """Cipher for the device file, built on first use."""
+        if self.key_file.exists():
+            return _CredentialCipher(self.key_file.read_bytes())
+        return _master_cipher(self.master_key_file, DEVICE_KEY_PURPOSE)
 
     def _create_device_id(self) -> str:
         """Generate new device ID and store securely."""
         device_id = str(uuid.uuid4())
 
-        # Generate encryption key
-        key = Fernet.generate_key()
-        self.key_file.write_bytes(key)
-        self.key_file.chmod(0o600)  # Read/write for owner only
-
         # Encrypt device ID
-        fernet = Fernet(key)
-        encrypted = fernet.encrypt(device_id.encode())
-        self.device_file.write_bytes(encrypted)
+        self.device_file.write_bytes(self._cipher.seal(device_id.encode()))
         self.device_file.chmod(0o600)
 
         return device_id
 
     def _load_device_id(self) -> str:
         """Load existing device ID."""
-        key = self.key_file.read_bytes()
-        encrypted = self.device_file.read_bytes()
-
-        fernet = Fernet(key)
-        return fernet.decrypt(encrypted).decode()
+        sealed = self.device_file.read_bytes()
+        return self._cipher.unseal(sealed).decode()
 
     def get_device_fingerprint(self) -> str:
         """
         Generate device fingerprint from system characteristics.
 
         Returns:
-            SHA256 hash of device characteristics
+            64-bit BLAKE2b hash of device characteristics (16 hex chars)
         """
+        if self._fingerprint is not None:
+            return self._fingerprint
+
         import platform
         import socket
 
         characteristics = [
-            platform.system(),
-            platform.machine(),
-            platform.node(),
-            socket.gethostname(),
-            str(Path.home()),
+            platform.system().encode(),
+            platform.machine().encode(),
+            platform.node().encode(),
+            socket.gethostname().encode(),
+            str(Path.home()).encode(),
         ]
 
-        fingerprint = hashlib.sha256(
-            '|'.join(characteristics).encode()
+        # Only needs to tell this user's devices apart, and it rides in
+        # every token payload, so 64 bits is plenty
+        self._fingerprint = hashlib.blake2b(
+            b'|'.join(characteristics), digest_size=8
         ).hexdigest()
 
-        return fingerprint
+        return self._fingerprint
 
     def revoke_device(self):
         """Revoke current device by deleting credentials."""
+        self._device_id = None
+        self.__dict__.pop('_cipher', None)
         if self.device_file.exists():
             self.device_file.unlink()
         if self.key_file.exists():
@@ -136,6 +373,12 @@ class JWTAuthManager:
     Implements secure token generation, validation, and lifecycle management.
     """
 
+    # Recently verified tokens kept to skip repeat HMAC checks and decoding
+    VALIDATION_CACHE_SIZE = 1024
+
+    # Revocations are appended to the blacklist log; fsync every N of them
+    BLACKLIST_SYNC_EVERY = 16
+
     def __init__(self, secret_key: Optional[str] = None, storage_dir: Optional[Path] = None):
         """
         Initialize JWT authentication manager.
@@ -157,28 +400,56 @@ class JWTAuthManager:
             self.secret_key = secrets.token_urlsafe(32)
             self.secret_file.write_text(self.secret_key)
             self.secret_file.chmod(0o600)
+        # Keyed HMAC state (ipad/opad blocks already hashed), copied per token
+        self._signing_hmac = hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256)
 
         # Device identity
-        self.device_identity = DeviceIdentity(self.storage_dir)
+        self.device_identity = DeviceIdentity(
+            self.storage_dir,
+            master_key_file=_master_key_file(storage_dir)
+        )
 
-        # Revoked tokens (in-memory for now, should use database in production)
+        # Revoked token IDs (jti claims), loaded once from the blacklist file
         self.revoked_tokens = set()
 
-        # Token blacklist file
-        self.blacklist_file = self.storage_dir / 'token_blacklist.json'
+        # Token blacklist: append-only log, one JTI per line
+        self.blacklist_file = self.storage_dir / 'token_blacklist.log'
         self._load_blacklist()
+        self._blacklist_log = _AppendLog(self.blacklist_file, self.BLACKLIST_SYNC_EVERY)
+        # Synced on garbage collection or interpreter exit, whichever comes
+        # first, without the exit hook keeping this manager alive
+        weakref.finalize(self, self._blacklist_log.close)
+
+        # LRU of verified payloads keyed by token digest. Expiry, revocation
+        # and fingerprint are re-checked on every hit.
+        self._verified: 'OrderedDict[bytes, Dict]' = OrderedDict()
+        self._verified_lock = threading.Lock()
 
     def _load_blacklist(self):
         """Load revoked token blacklist."""
+        # Duplicate lines from concurrent writers are harmless; the log is
+        # never rewritten in place, so open append handles stay valid
         if self.blacklist_file.exists():
-            with open(self.blacklist_file, 'r') as f:
-                data = json.load(f)
-                self.revoked_tokens = set(data.get('tokens', []))
-
-    def _save_blacklist(self):
-        """Save revoked token blacklist."""
-        with open(self.blacklist_file, 'w') as f:
-            json.dump({'tokens': list(self.revoked_tokens)}, f)
+            self.revoked_tokens = set(filter(None, self.blacklist_file.read_text().splitlines()))
+
+        # Fold in the JSON blacklist written by older releases
+        legacy_file = self.storage_dir / 'token_blacklist.json'
+        if legacy_file.exists():
+            legacy = set(_loads(legacy_file.read_bytes()).get('tokens', []))
+            missing = legacy - self.revoked_tokens
+            if missing:
+                with open(self.blacklist_file, 'a') as log:
+                    log.write(''.join(f"{jti}\n" for jti in missing))
+            self.revoked_tokens |= legacy
+            legacy_file.unlink()
+
+    def _append_blacklist(self, jti: str):
+        """Record a revoked JTI with a single append."""
+        self._blacklist_log.append(jti)
+
+    def close(self):
+        """Sync and close the blacklist log."""
+        self._blacklist_log.close()
 
     def generate_token(
         self,
@@ -202,13 +473,13 @@ class JWTAuthManager:
         if device_id is None:
             device_id = self.device_identity.get_device_id()
 
-        now = datetime.utcnow()
+        now = int(time.time())
 
         payload = {
             'iat': now,  # Issued at
-            'exp': now + timedelta(seconds=expires_in),  # Expiration
+            'exp': now + expires_in,  # Expiration
             'nbf': now,  # Not before
-            'jti': secrets.token_urlsafe(16),  # Unique token ID
+            'jti': _new_jti(),  # Unique token ID
             'sub': user_id or 'anonymous',  # Subject (user ID)
             'device_id': device_id,
             'device_fp': self.device_identity.get_device_fingerprint(),
@@ -216,8 +487,7 @@ class JWTAuthManager:
             'token_type': 'access'
         }
 
-        token = jwt.encode(payload, self.secret_key, algorithm='HS256')
-        return token
+        return _sign_hs256(payload, self._signing_hmac)
 
     def generate_refresh_token(
         self,
@@ -239,19 +509,18 @@ class JWTAuthManager:
         if device_id is None:
             device_id = self.device_identity.get_device_id()
 
-        now = datetime.utcnow()
+        now = int(time.time())
 
         payload = {
             'iat': now,
-            'exp': now + timedelta(seconds=expires_in),
-            'jti': secrets.token_urlsafe(16),
+            'exp': now + expires_in,
+            'jti': _new_jti(),
             'sub': user_id or 'anonymous',
             'device_id': device_id,
             'token_type': 'refresh'
         }
 
-        token = jwt.encode(payload, self.secret_key, algorithm='HS256')
-        return token
+        return _sign_hs256(payload, self._signing_hmac)
 
     def validate_token(self, token: str, required_scopes: Optional[List[str]] = None) -> Dict:
         """
@@ -268,30 +537,49 @@ class JWTAuthManager:
             jwt.InvalidTokenError: If token is invalid
             PermissionError: If token lacks required scopes
         """
-        # Check if token is revoked
-        if token in self.revoked_tokens:
-            raise jwt.InvalidTokenError("Token has been revoked")
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with self._verified_lock:
+            payload = self._verified.get(cache_key)
+            if payload is not None:
+                if payload.get('exp', 0) > time.time():
+                    self._verified.move_to_end(cache_key)
+                else:
+                    del self._verified[cache_key]
+                    payload = None
 
-        # Decode and validate token
-        try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=['HS256'],
-                options={
-                    'verify_exp': True,
-                    'verify_iat': True,
-                    'verify_nbf': True
-                }
-            )
-        except jwt.ExpiredSignatureError:
-            raise jwt.InvalidTokenError("Token has expired")
-        except jwt.InvalidTokenError as e:
-            raise jwt.InvalidTokenError(f"Invalid token: {e}")
+        current_fp = self.device_identity.get_device_fingerprint()
+
+        if payload is None:
+            # Tokens minted for another device are rejected before paying
+            # for signature verification
+            claims = _unverified_claims(token)
+            if claims is not None and not _same_fingerprint(claims.get('device_fp'), current_fp):
+                raise jwt.InvalidTokenError("Device fingerprint mismatch")
+
+            # Decode and validate token
+            try:
+                payload = jwt.decode(
+                    token,
+                    self.secret_key,
+                    algorithms=_ALGORITHMS,
+                    options=_VALIDATE_OPTIONS
+                )
+            except jwt.ExpiredSignatureError:
+                raise jwt.InvalidTokenError("Token has expired")
+            except jwt.InvalidTokenError as e:
+                raise jwt.InvalidTokenError(f"Invalid token: {e}")
+
+            with self._verified_lock:
+                self._verified[cache_key] = payload
+                if len(self._verified) > self.VALIDATION_CACHE_SIZE:
+                    self._verified.popitem(last=False)
+
+        # Check if token is revoked (the blacklist holds JTIs, not raw tokens)
+        if payload.get('jti') in self.revoked_tokens:
+            raise jwt.InvalidTokenError("Token has been revoked")
 
         # Verify device fingerprint
-        current_fp = self.device_identity.get_device_fingerprint()
-        if payload.get('device_fp') != current_fp:
+        if not _same_fingerprint(payload.get('device_fp'), current_fp):
             raise jwt.InvalidTokenError("Device fingerprint mismatch")
 
         # Check required scopes
@@ -302,7 +590,7 @@ class JWTAuthManager:
                 missing = required - token_scopes
                 raise PermissionError(f"Missing required scopes: {missing}")
 
-        return payload
+        return dict(payload)
 
     def revoke_token(self, token: str):
         """
@@ -312,11 +600,11 @@ class JWTAuthManager:
             token: Token to revoke
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=['HS256'], options={'verify_exp': False})
+            payload = jwt.decode(token, self.secret_key, algorithms=_ALGORITHMS, options=_REVOKE_OPTIONS)
             jti = payload.get('jti')
-            if jti:
+            if jti and jti not in self.revoked_tokens:
                 self.revoked_tokens.add(jti)
-                self._save_blacklist()
+                self._append_blacklist(jti)
         except jwt.InvalidTokenError:
             pass  # Token already invalid
 
@@ -336,7 +624,7 @@ class JWTAuthManager:
         payload = jwt.decode(
             refresh_token,
             self.secret_key,
-            algorithms=['HS256']
+            algorithms=_ALGORITHMS
         )
 
         if payload.get('token_type') != 'refresh':
@@ -367,7 +655,8 @@ class NotionOAuthManager:
         client_id: str,
         client_secret: str,
         redirect_uri: str,
-        storage_dir: Optional[Path] = None
+        storage_dir: Optional[Path] = None,
+        master_key_file: Optional[Path] = None
     ):
         """
         Initialize OAuth manager.
@@ -377,16 +666,20 @@ class NotionOAuthManager:
             client_secret: Notion OAuth client secret
             redirect_uri: Callback URL for authorization
             storage_dir: Directory for token storage
+            master_key_file: Master key to derive the token key from
+                (default: the shared config-directory key for the default
+                storage_dir, otherwise .master_key in storage_dir)
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
 
+        self.master_key_file = master_key_file or _master_key_file(storage_dir)
         self.storage_dir = storage_dir or Path.home() / '.perplexity-notion' / 'oauth'
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.token_file = self.storage_dir / 'notion_tokens.enc'
-        self.key_file = self.storage_dir / '.oauth_key'
+        self.key_file = self.storage_dir / '.oauth_key'  # Legacy per-file key
 
     def get_authorization_url(self, state: Optional[str] = None) -> Tuple[str, str]:
         """
@@ -427,7 +720,6 @@ class NotionOAuthManager:
         # Encode credentials
         auth_string = f"{self.client_id}:{self.client_secret}"
         auth_bytes = auth_string.encode('ascii')
-        import base64
         auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
 
         headers = {
@@ -457,19 +749,16 @@ class NotionOAuthManager:
 
         return token_data
 
+    @functools.cached_property
+    def _cipher(self) -> _CredentialCipher:
+        """Cipher for the token file, built on first use."""
+        if self.key_file.exists():
+            return _CredentialCipher(self.key_file.read_bytes())
+        return _master_cipher(self.master_key_file, OAUTH_KEY_PURPOSE)
+
     def _save_tokens(self, token_data: Dict):
         """Save OAuth tokens with encryption."""
-        # Generate encryption key if not exists
-        if not self.key_file.exists():
-            key = Fernet.generate_key()
-            self.key_file.write_bytes(key)
-            self.key_file.chmod(0o600)
-
-        key = self.key_file.read_bytes()
-        fernet = Fernet(key)
-
-        # Encrypt and save
-        encrypted = fernet.encrypt(json.dumps(token_data).encode())
+        encrypted = self._cipher.seal(_dumps(token_data))
         self.token_file.write_bytes(encrypted)
         self.token_file.chmod(0o600)
 
@@ -478,13 +767,8 @@ class NotionOAuthManager:
         if not self.token_file.exists():
             return None
 
-        key = self.key_file.read_bytes()
-        encrypted = self.token_file.read_bytes()
-
-        fernet = Fernet(key)
-        decrypted = fernet.decrypt(encrypted)
-
-        return json.loads(decrypted)
+        sealed = self.token_file.read_bytes()
+        return _loads(self._cipher.unseal(sealed))
 
     def get_access_token(self) -> Optional[str]:
         """Get current access token if available."""
@@ -499,7 +783,7 @@ class RateLimiter:
     Prevents abuse by limiting requests per time window.
     """
 
-    def __init__(self, rate: int = 10, per: int = 60, burst: int = 15):
+    def __init__(self, rate: int = 10, per: int = 60, burst: int = 15, max_clients: int = 10000):
         """
         Initialize rate limiter.
 
@@ -507,13 +791,18 @@ class RateLimiter:
             rate: Number of requests allowed per time window
             per: Time window in seconds
             burst: Maximum burst size
+            max_clients: Buckets kept before the least recently seen is dropped
         """
         self.rate = rate
         self.per = per
         self.burst = burst
+        self.max_clients = max_clients
+        self._refill_rate = rate / per
+        # Idle time after which any bucket is full again
+        self._refill_time = burst / self._refill_rate
 
-        # Per-client buckets: {client_id: (tokens, last_update)}
-        self.buckets: Dict[str, Tuple[float, float]] = {}
+        # Per-client buckets in LRU order: {client_id: (tokens, last_update)}
+        self.buckets: 'OrderedDict[str, Tuple[float, float]]' = OrderedDict()
 
     def is_allowed(self, client_id: str) -> bool:
         """
@@ -525,27 +814,53 @@ class RateLimiter:
         Returns:
             True if request allowed, False if rate limited
         """
-        now = time.time()
+        return self._consume(client_id, time.monotonic())
 
-        if client_id not in self.buckets:
+    def are_allowed(self, client_ids: Iterable[str]) -> List[bool]:
+        """
+        Check a batch of requests against one clock reading.
+
+        Repeated IDs are charged in order, exactly as successive
+        is_allowed() calls would be.
+
+        Args:
+            client_ids: Client identifiers, one per request
+
+        Returns:
+            Allow/deny flag for each request
+        """
+        now = time.monotonic()
+        consume = self._consume
+        return [consume(client_id, now) for client_id in client_ids]
+
+    def _consume(self, client_id: str, now: float) -> bool:
+        """Refill the client's bucket to now and take a token if possible."""
+        buckets = self.buckets
+
+        if client_id not in buckets:
             # New client, initialize with full bucket
-            self.buckets[client_id] = (self.burst - 1, now)
+            buckets[client_id] = (self.burst - 1, now)
+            if len(buckets) > self.max_clients:
+                buckets.popitem(last=False)
             return True
 
-        tokens, last_update = self.buckets[client_id]
+        buckets.move_to_end(client_id)
+        tokens, last_update = buckets[client_id]
 
         # Calculate tokens to add based on time elapsed
         elapsed = now - last_update
-        tokens_to_add = elapsed * (self.rate / self.per)
-        tokens = min(self.burst, tokens + tokens_to_add)
+        if elapsed >= self._refill_time:
+            tokens = self.burst
+        else:
+            tokens = min(self.burst, tokens + elapsed * self._refill_rate)
 
         if tokens >= 1:
             # Allow request and consume token
-            self.buckets[client_id] = (tokens - 1, now)
+            buckets[client_id] = (tokens - 1, now)
             return True
         else:
             # Rate limited
-            self.buckets[client_id] = (tokens, now)
+            buckets[client_id] = (tokens, now)
             return False
 
     def get_retry_after(self, client_id: str) -> float:
@@ -575,6 +890,7 @@ class RateLimiter:
 if __name__ == '__main__':
     print("Enhanced Authentication Manager - Test Suite")
     print("=" * 60)
+    print(f"SHA-256 backend: {'OpenSSL' if OPENSSL_SHA256 else 'builtin'} ({ssl.OPENSSL_VERSION})")
 
     # Test JWT auth
     print("\n1. Testing JWT Authentication...")
@@ -17,17 +17,46 @@ License: MIT
 """
 
 import argparse
-import subprocess
+import os
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+    from cryptography.x509.oid import NameOID
+except ImportError:
+    print("⚠️  Security dependencies missing. Install with:")
+    print("pip install cryptography")
+    raise
+
+KEY_TYPES = ('ecdsa-p256', 'ed25519', 'rsa')
+
+
+def _generate_key(key_type: str, key_size: int):
+    """
+    Create a private key and the digest its certificate is signed with.
+
+    Returns:
+        Tuple of (private_key, hash_algorithm); Ed25519 signs without a
+        separate digest, so its hash algorithm is None.
+    """
+    if key_type == 'ed25519':
+        return ed25519.Ed25519PrivateKey.generate(), None
+    if key_type == 'ecdsa-p256':
+        return ec.generate_private_key(ec.SECP256R1()), hashes.SHA256()
+    return rsa.generate_private_key(public_exponent=65537, key_size=key_size), hashes.SHA256()
 
 
 def generate_certificate(
     domain: str,
     output_dir: Path,
     days: int = 365,
-    key_size: int = 4096
+    key_size: int = 4096,
+    key_type: str = 'ecdsa-p256'
 ) -> bool:
     """
     Generate self-signed SSL certificate.
@@ -36,7 +65,8 @@ def generate_certificate(
         domain: Domain name for certificate
         output_dir: Directory to store certificate files
         days: Certificate validity period in days
-        key_size: RSA key size in bits
+        key_size: RSA key size in bits (ignored for other key types)
+        key_type: One of KEY_TYPES
 
     Returns:
         True if successful
@@ -47,35 +77,53 @@ def generate_certificate(
     key_file = output_dir / 'key.pem'
 
     print(f"🔐 Generating SSL certificate for {domain}...")
-    print(f"   Key size: {key_size} bits")
+    if key_type == 'rsa':
+        print(f"   Key: RSA {key_size} bits")
+    else:
+        print(f"   Key: {key_type}")
     print(f"   Valid for: {days} days")
     print(f"   Output: {output_dir}")
 
-    # Generate certificate using OpenSSL
-    cmd = [
-        'openssl', 'req',
-        '-x509',
-        '-newkey', f'rsa:{key_size}',
-        '-keyout', str(key_file),
-        '-out', str(cert_file),
-        '-days', str(days),
-        '-nodes',
-        '-subj', f'/CN={domain}/O=Perplexity-to-Notion/C=US'
-    ]
-
+    # Generate key and certificate in-process (same OpenSSL primitives as
+    # `openssl req -x509`, without spawning the CLI)
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
+        key, algorithm = _generate_key(key_type, key_size)
+
+        name = x509.Name([
+            x509.NameAttribute(NameOID.COMMON_NAME, domain),
+            x509.NameAttribute(NameOID.ORGANIZATION_NAME, 'Perplexity-to-Notion'),
+            x509.NameAttribute(NameOID.COUNTRY_NAME, 'US'),
+        ])
+        now = datetime.now(timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=days))
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+            .add_extension(x509.SubjectKeyIdentifier.from_public_key(key.public_key()), critical=False)
+            .sign(key, algorithm)
         )
 
+        # Created 0600 (as openssl req does) so the key is never world-readable;
+        # fchmod also tightens a key file left over from an earlier run
+        key_fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(key_fd, 'wb') as f:
+            os.fchmod(f.fileno(), 0o600)
+            f.write(key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            ))
+        cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
         print(f"✓ Certificate generated: {cert_file}")
         print(f"✓ Private key generated: {key_file}")
 
         # Set proper permissions
-        key_file.chmod(0o600)
         cert_file.chmod(0o644)
 
         print(f"\n⚠️  WARNING: This is a self-signed certificate!")
@@ -85,7 +133,7 @@ def generate_certificate(
 
         # Display certificate info
         print(f"\n📋 Certificate Information:")
-        display_cert_info(cert_file)
+        display_cert_info(cert_file, cert)
 
         # Usage instructions
         print(f"\n📝 Usage in webhook server:")
@@ -95,35 +143,26 @@ def generate_certificate(
 
         return True
 
-    except FileNotFoundError:
-        print("❌ Error: OpenSSL not found")
-        print("   Install OpenSSL:")
-        print("     Ubuntu/Debian: sudo apt install openssl")
-        print("     macOS: brew install openssl")
-        print("     Termux: pkg install openssl")
-        return False
-
-    except subprocess.CalledProcessError as e:
+    except (ValueError, OSError) as e:
         print(f"❌ Error generating certificate: {e}")
-        print(e.stderr)
         return False
 
 
-def display_cert_info(cert_file: Path):
+def display_cert_info(cert_file: Path, cert: Optional['x509.Certificate'] = None):
     """Display certificate information."""
-    cmd = ['openssl', 'x509', '-in', str(cert_file), '-text', '-noout']
-
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        if cert is None:
+            cert = x509.load_pem_x509_certificate(cert_file.read_bytes())
+    except (ValueError, OSError):
+        return
 
-        # Extract key information
-        lines = result.stdout.split('\n')
-        for line in lines:
-            if 'Subject:' in line or 'Not Before' in line or 'Not After' in line:
-                print(f"   {line.strip()}")
+    # *_utc accessors appeared in cryptography 42; older releases return naive UTC
+    not_before = getattr(cert, 'not_valid_before_utc', None) or cert.not_valid_before
+    not_after = getattr(cert, 'not_valid_after_utc', None) or cert.not_valid_after
 
-    except subprocess.CalledProcessError:
-        pass
+    print(f"   Subject: {cert.subject.rfc4514_string()}")
+    print(f"   Not Before: {not_before:%Y-%m-%d %H:%M:%S} UTC")
+    print(f"   Not After : {not_after:%Y-%m-%d %H:%M:%S} UTC")
 
 
 def check_certificate(cert_file: Path, key_file: Path) -> bool:
@@ -139,26 +178,22 @@ def check_certificate(cert_file: Path, key_file: Path) -> bool:
     """
     print(f"\n🔍 Verifying certificate and key...")
 
-    # Check certificate
-    cmd_cert = ['openssl', 'x509', '-in', str(cert_file), '-noout', '-modulus']
-    # Check key
-    cmd_key = ['openssl', 'rsa', '-in', str(key_file), '-noout', '-modulus']
-
     try:
-        result_cert = subprocess.run(cmd_cert, capture_output=True, text=True, check=True)
-        result_key = subprocess.run(cmd_key, capture_output=True, text=True, check=True)
-
-        if result_cert.stdout == result_key.stdout:
-            print("✓ Certificate and key match")
-            return True
-        else:
-            print("❌ Certificate and key do NOT match")
-            return False
-
-    except subprocess.CalledProcessError as e:
+        cert = x509.load_pem_x509_certificate(cert_file.read_bytes())
+        key = serialization.load_pem_private_key(key_file.read_bytes(), password=None)
+    except (ValueError, TypeError, OSError) as e:
         print(f"❌ Verification failed: {e}")
         return False
 
+    # Comparing the encoded public keys works for RSA, EC and Ed25519 alike
+    spki = (serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo)
+    if cert.public_key().public_bytes(*spki) == key.public_key().public_bytes(*spki):
+        print("✓ Certificate and key match")
+        return True
+    else:
+        print("❌ Certificate and key do NOT match")
+        return False
+
 
 def main():
     """Main entry point."""
@@ -173,6 +208,9 @@ Examples:
   # Generate certificate for specific domain with custom validity
   python generate_https_cert.py --domain api.example.com --days 365
 
+  # RSA certificate for older TLS clients
+  python generate_https_cert.py --key-type rsa --key-size 2048
+
   # Check existing certificate
   python generate_https_cert.py --check ../certs/cert.pem ../certs/key.pem
 
@@ -199,12 +237,19 @@ Production Note:
         default=365,
         help='Certificate validity in days (default: 365)'
     )
+    parser.add_argument(
+        '--key-type',
+        default='ecdsa-p256',
+        choices=KEY_TYPES,
+        help='Key algorithm (default: ecdsa-p256; ed25519 is not accepted by '
+             'browsers or iOS; rsa for legacy TLS clients)'
+    )
     parser.add_argument(
         '--key-size',
         type=int,
         default=4096,
         choices=[2048, 4096, 8192],
-        help='RSA key size in bits (default: 4096)'
+        help='RSA key size in bits, with --key-type rsa (default: 4096)'
     )
     parser.add_argument(
         '--check',
@@ -242,7 +287,8 @@ Production Note:
             domain=args.domain,
             output_dir=args.output_dir,
             days=args.days,
-            key_size=args.key_size
+            key_size=args.key_size,
+            key_type=args.key_type
         )
 
         if success:
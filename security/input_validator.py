@@ -17,10 +17,108 @@ License: MIT
 
 import re
 import html
-from urllib.parse import urlparse, parse_qs
-from typing import Optional, List, Dict, Any
+import socket
+import threading
+import time
+import functools
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+from typing import Optional, List, Dict, Tuple, Any
 import ipaddress
 
+# Optional Hyperscan for bulk suspicious-pattern scans (re is used when missing)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Resolved addresses repeat (a handful of hosts); parse each string once
+_cached_ip_address = functools.lru_cache(maxsize=256)(ipaddress.ip_address)
+
+# Root that validated paths must stay within
+_HOME = Path.home()
+
+# DNS answers for resolve_and_validate_ip: {hostname: (expires_at, ip or None)}.
+# Failed lookups are remembered briefly so a flapping resolver isn't hammered.
+_DNS_TTL = 300.0
+_DNS_NEGATIVE_TTL = 10.0
+_DNS_CACHE_SIZE = 1024
+_dns_cache: Dict[str, tuple] = {}
+_dns_lock = threading.Lock()
+
+
+def _resolve_host(hostname: str) -> Optional[str]:
+    """Resolve hostname to an IPv4 string via a small TTL cache; None on failure."""
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(hostname)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    try:
+        ip_str = socket.gethostbyname(hostname)
+        expires_at = now + _DNS_TTL
+    except socket.gaierror:
+        ip_str = None
+        expires_at = now + _DNS_NEGATIVE_TTL
+
+    with _dns_lock:
+        if len(_dns_cache) >= _DNS_CACHE_SIZE:
+            _dns_cache.clear()
+        _dns_cache[hostname] = (expires_at, ip_str)
+    return ip_str
+
+
+def _hyperscan_matcher(patterns):
+    """
+    Compile literal patterns into one caseless Hyperscan database.
+
+    Returns a predicate telling whether any pattern occurs in a string,
+    or None when Hyperscan isn't installed.
+    """
+    if hyperscan is None:
+        return None
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(p).encode('ascii') for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+    )
+    # The database owns a single scratch space, so scans are serialized
+    lock = threading.Lock()
+
+    def on_match(pattern_id, start, end, flags, hits):
+        hits.append(pattern_id)
+        return True  # first hit is enough; stop scanning
+
+    def contains_any(text: str) -> bool:
+        hits = []
+        with lock:
+            db.scan(text.encode('utf-8', 'surrogatepass'),
+                    match_event_handler=on_match, context=hits)
+        return bool(hits)
+
+    return contains_any
+
+
+def _index_networks(networks) -> Dict[int, tuple]:
+    """
+    Group networks by IP version as (network_int, netmask_int, network).
+
+    Membership then costs one integer mask per same-family range instead
+    of ip_network's generic containment check.
+    """
+    return {
+        version: tuple(
+            (int(n.network_address), int(n.netmask), n)
+            for n in networks if n.version == version
+        )
+        for version in (4, 6)
+    }
+
 
 class URLValidator:
     """
@@ -28,14 +126,19 @@ class URLValidator:
     """
 
     # Allowed URL schemes
-    ALLOWED_SCHEMES = ['https']
+    ALLOWED_SCHEMES = frozenset({'https'})
 
     # Domain whitelist for Perplexity
-    ALLOWED_DOMAINS = [
+    ALLOWED_DOMAINS = frozenset({
         'perplexity.ai',
         'www.perplexity.ai',
         'api.perplexity.ai'
-    ]
+    })
+
+    # Every acceptable URL starts with one of these (compared lowercased);
+    # lets callers reject foreign URLs without parsing them
+    ALLOWED_PREFIXES = tuple('https://' + d for d in sorted(ALLOWED_DOMAINS))
+    _PREFIX_SCAN_LEN = max(map(len, ALLOWED_PREFIXES))
 
     # Blocked IP ranges (private networks, localhost, etc.)
     BLOCKED_IP_RANGES = [
@@ -51,9 +154,39 @@ class URLValidator:
         'fe80::/10',        # IPv6 link-local
         'fc00::/7',         # IPv6 private
     ]
+    _BLOCKED_NETWORKS = tuple(ipaddress.ip_network(r) for r in BLOCKED_IP_RANGES)
+    _BLOCKED_BY_VERSION = _index_networks(_BLOCKED_NETWORKS)
+
+    # Substrings that make an otherwise whitelisted URL suspicious
+    SUSPICIOUS_PATTERNS = [
+        '@',           # Credentials in URL
+        '../',         # Path traversal
+        '..\\',        # Path traversal (Windows)
+        '<script',     # XSS attempt
+        'javascript:', # JavaScript protocol
+        'file://',     # Local file access
+    ]
+    _SUSPICIOUS_RE = re.compile('|'.join(map(re.escape, SUSPICIOUS_PATTERNS)))
+    _suspicious_scan = _hyperscan_matcher(SUSPICIOUS_PATTERNS)
+
+    # Cheap syntactic check for "this input is a web URL" (not a safety check)
+    HTTP_URL_RE = re.compile(r'https?://[^\s/?#]+\S*', re.IGNORECASE)
+
+    @classmethod
+    def looks_like_url(cls, text: str) -> bool:
+        """
+        Check whether free-form input is an http(s) URL rather than prose.
+
+        Args:
+            text: User-supplied source string
+
+        Returns:
+            True if the whole (stripped) input is a single http(s) URL
+        """
+        return cls.HTTP_URL_RE.fullmatch(text.strip()) is not None
 
     @classmethod
-    def validate_url(cls, url: str) -> tuple[bool, str]:
+    def validate_url(cls, url: str) -> Tuple[bool, str]:
         """
         Validate URL for safety.
 
@@ -63,54 +196,69 @@ class URLValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        return cls._validate_url_host(url)[:2]
+
+    @classmethod
+    def _validate_url_host(cls, url: str) -> Tuple[bool, str, Optional[str]]:
+        """
+        validate_url, also returning the parsed hostname (None if invalid).
+
+        Lets callers that go on to resolve the host reuse the parse.
+        """
         # Check if URL is provided
         if not url or not isinstance(url, str):
-            return False, "URL is required and must be a string"
+            return False, "URL is required and must be a string", None
 
         # Remove leading/trailing whitespace
         url = url.strip()
 
         # Check length
         if len(url) > 2048:
-            return False, "URL exceeds maximum length (2048 characters)"
+            return False, "URL exceeds maximum length (2048 characters)", None
+
+        return cls._validate_stripped_url(url)
 
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _validate_stripped_url(cls, url: str) -> Tuple[bool, str, Optional[str]]:
+        """
+        Parse-and-check part of validate_url, memoized per URL.
+
+        The same source URL typically appears many times in one page
+        (inline citations, source list), and the result depends only on
+        the URL and the class-level whitelists.
+        """
         # Parse URL
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
         except Exception as e:
-            return False, f"Invalid URL format: {e}"
+            return False, f"Invalid URL format: {e}", None
 
         # Check scheme
         if parsed.scheme not in cls.ALLOWED_SCHEMES:
-            return False, f"URL scheme must be one of: {', '.join(cls.ALLOWED_SCHEMES)}"
+            return False, f"URL scheme must be one of: {', '.join(sorted(cls.ALLOWED_SCHEMES))}", None
 
-        # Check domain whitelist
+        # Check domain whitelist (every entry is a name, so this also
+        # rules out direct IP addresses)
         if parsed.hostname not in cls.ALLOWED_DOMAINS:
-            return False, f"Domain must be one of: {', '.join(cls.ALLOWED_DOMAINS)}"
+            return False, f"Domain must be one of: {', '.join(sorted(cls.ALLOWED_DOMAINS))}", None
 
-        # Check for IP address (should use domain)
-        try:
-            ipaddress.ip_address(parsed.hostname)
-            return False, "Direct IP addresses are not allowed"
-        except ValueError:
-            pass  # Not an IP address, good
-
-        # Check for suspicious patterns
-        suspicious_patterns = [
-            '@',           # Credentials in URL
-            '../',         # Path traversal
-            '..\\',        # Path traversal (Windows)
-            '<script',     # XSS attempt
-            'javascript:', # JavaScript protocol
-            'file://',     # Local file access
-        ]
+        # Check for suspicious patterns (one scan for all of them). With
+        # Hyperscan, clean URLs skip the lowercase copy and regex entirely;
+        # the regex still names the pattern on a hit.
+        if cls._suspicious_scan is None or cls._suspicious_scan(url):
+            match = cls._SUSPICIOUS_RE.search(url.lower())
+            if match:
+                return False, f"URL contains suspicious pattern: {match.group(0)}", None
 
-        url_lower = url.lower()
-        for pattern in suspicious_patterns:
-            if pattern in url_lower:
-                return False, f"URL contains suspicious pattern: {pattern}"
+        return True, "", parsed.hostname
 
-        return True, ""
+    @classmethod
+    def clear_caches(cls):
+        """Forget memoized URL verdicts and cached DNS answers (e.g. after changing whitelists)."""
+        cls._validate_stripped_url.cache_clear()
+        with _dns_lock:
+            _dns_cache.clear()
 
     @classmethod
     def sanitize_url(cls, url: str) -> str:
@@ -123,7 +271,7 @@ class URLValidator:
         Returns:
             Sanitized URL
         """
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
 
         # Rebuild URL with safe components only
         safe_url = f"{parsed.scheme}://{parsed.hostname}"
@@ -142,7 +290,7 @@ class URLValidator:
         return safe_url
 
     @classmethod
-    def resolve_and_validate_ip(cls, hostname: str) -> tuple[bool, str]:
+    def resolve_and_validate_ip(cls, hostname: str) -> Tuple[bool, str]:
         """
         Resolve hostname and validate IP is not in blocked ranges.
 
@@ -154,23 +302,21 @@ class URLValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        import socket
-
         try:
-            # Resolve hostname to IP
-            ip_str = socket.gethostbyname(hostname)
-            ip = ipaddress.ip_address(ip_str)
+            # Resolve hostname to IP (cached for _DNS_TTL seconds)
+            ip_str = _resolve_host(hostname)
+            if ip_str is None:
+                return False, "Failed to resolve hostname"
+            ip = _cached_ip_address(ip_str)
+            ip_int = int(ip)
 
             # Check against blocked ranges
-            for blocked_range in cls.BLOCKED_IP_RANGES:
-                network = ipaddress.ip_network(blocked_range)
-                if ip in network:
-                    return False, f"Resolved IP {ip_str} is in blocked range {blocked_range}"
+            for network_int, netmask_int, network in cls._BLOCKED_BY_VERSION[ip.version]:
+                if ip_int & netmask_int == network_int:
+                    return False, f"Resolved IP {ip_str} is in blocked range {network}"
 
             return True, ""
 
-        except socket.gaierror:
-            return False, "Failed to resolve hostname"
         except Exception as e:
             return False, f"IP validation error: {e}"
 
@@ -186,6 +332,13 @@ class ContentSanitizer:
     MAX_BLOCKS = 100
     MAX_NESTING_DEPTH = 2
 
+    # C0/C1 control characters and DEL, minus newline and tab
+    _CONTROL_CHARS_RE = re.compile('[\x00-\x08\x0b-\x1f\x7f-\x9f]')
+    _KEPT_WHITESPACE_RE = re.compile('[\n\t]')
+
+    # Characters that matter if the text is ever rendered as HTML
+    _HTML_UNSAFE_RE = re.compile('[&<>]')
+
     @classmethod
     def sanitize_text(cls, text: str, max_length: Optional[int] = None) -> str:
         """
@@ -203,11 +356,18 @@ class ContentSanitizer:
 
         max_length = max_length or cls.MAX_TEXT_LENGTH
 
-        # Remove control characters except newlines and tabs
-        text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
+        # Remove control characters except newlines and tabs. One regex pass
+        # covers C0/C1; other non-printables (format characters, unusual
+        # spaces) need the per-char filter, which only runs when one is
+        # actually present.
+        text = cls._CONTROL_CHARS_RE.sub('', text)
+        if not text.isascii() and not all(map(str.isprintable, cls._KEPT_WHITESPACE_RE.split(text))):
+            text = ''.join(char for char in text if char.isprintable() or char in '\n\t')
 
-        # HTML escape to prevent XSS
-        text = html.escape(text)
+        # HTML escape to prevent XSS. Text goes into Notion as JSON, so
+        # quotes need no escaping; most prose needs none at all.
+        if cls._HTML_UNSAFE_RE.search(text):
+            text = html.escape(text, quote=False)
 
         # Truncate if too long
         if len(text) > max_length:
@@ -229,12 +389,23 @@ class ContentSanitizer:
         return cls.sanitize_text(title, max_length=cls.MAX_TITLE_LENGTH)
 
     @classmethod
-    def validate_notion_blocks(cls, blocks: List[Dict]) -> tuple[bool, str, List[Dict]]:
+    def validate_notion_blocks(
+        cls,
+        blocks: List[Dict],
+        inplace: bool = False
+    ) -> Tuple[bool, str, List[Dict]]:
         """
         Validate and sanitize Notion block structure.
 
+        Type-specific content (rich_text, children) is always rewritten in
+        place. With inplace=True the block dicts and lists themselves are
+        reused too: extra top-level keys are dropped from each block and
+        the input list is returned, so no second copy of the tree is
+        built. On failure the input may be left partially sanitized.
+
         Args:
             blocks: List of Notion block dictionaries
+            inplace: Sanitize the given blocks instead of building new ones
 
         Returns:
             Tuple of (is_valid, error_message, sanitized_blocks)
@@ -245,7 +416,14 @@ class ContentSanitizer:
         if len(blocks) > cls.MAX_BLOCKS:
             return False, f"Too many blocks (max {cls.MAX_BLOCKS})", []
 
-        sanitized = []
+        # Validate each distinct link once up front; pages cite the same
+        # sources over and over
+        url_validity = {
+            url: URLValidator.validate_url(url)[0]
+            for url in cls._collect_link_urls(blocks)
+        }
+
+        sanitized = blocks if inplace else []
 
         for i, block in enumerate(blocks):
             if not isinstance(block, dict):
@@ -261,21 +439,70 @@ class ContentSanitizer:
 
             # Sanitize based on type
             try:
-                sanitized_block = cls._sanitize_block(block, depth=0)
-                sanitized.append(sanitized_block)
+                sanitized_block = cls._sanitize_block(
+                    block, depth=0, url_validity=url_validity, inplace=inplace
+                )
+                if not inplace:
+                    sanitized.append(sanitized_block)
             except ValueError as e:
                 return False, f"Block {i} validation failed: {e}", []
 
         return True, "", sanitized
 
+    @staticmethod
+    def _collect_link_urls(blocks: List[Dict]) -> set:
+        """
+        Gather every rich_text link URL in a block tree.
+
+        Tolerates malformed blocks (they are rejected later by the
+        sanitizing pass); only string URLs are returned.
+        """
+        urls = set()
+        stack = list(blocks)
+
+        while stack:
+            block = stack.pop()
+            if not isinstance(block, dict) or not isinstance(block.get('type'), str):
+                continue
+            type_content = block.get(block['type'])
+            if not isinstance(type_content, dict):
+                continue
+
+            rich_text = type_content.get('rich_text')
+            for rt in rich_text if isinstance(rich_text, list) else ():
+                text = rt.get('text') if isinstance(rt, dict) else None
+                link = text.get('link') if isinstance(text, dict) else None
+                if isinstance(link, dict) and isinstance(link.get('url'), str):
+                    urls.add(link['url'])
+
+            children = type_content.get('children')
+            if isinstance(children, list):
+                stack.extend(children)
+
+        return urls
+
     @classmethod
-    def _sanitize_block(cls, block: Dict, depth: int) -> Dict:
+    def _sanitize_block(
+        cls,
+        block: Dict,
+        depth: int,
+        url_validity: Optional[Dict[str, bool]] = None,
+        inplace: bool = False
+    ) -> Dict:
         """
-        Recursively sanitize a single block.
+        Sanitize a single block and its nested children.
+
+        Walks the tree with an explicit stack rather than recursion; each
+        entry carries the slot its sanitized block is written to. Outside
+        inplace mode a block's new children list is attached only after all
+        of its children succeed, so a failure deep in the tree leaves the
+        caller's children lists as they were.
 
         Args:
             block: Block dictionary
-            depth: Current nesting depth
+            depth: Nesting depth of block
+            url_validity: Pre-validated link URLs (validated on demand if missing)
+            inplace: Trim and return the given dicts instead of new ones
 
         Returns:
             Sanitized block
@@ -283,57 +510,93 @@ class ContentSanitizer:
         Raises:
             ValueError: If block structure is invalid
         """
-        if depth > cls.MAX_NESTING_DEPTH:
-            raise ValueError(f"Nesting depth exceeds maximum ({cls.MAX_NESTING_DEPTH})")
-
-        block_type = block['type']
-        sanitized = {
-            'object': 'block',
-            'type': block_type
-        }
-
-        type_content = block[block_type]
-
-        # Sanitize rich text
-        if 'rich_text' in type_content:
-            sanitized_rich_text = []
-
-            for rt in type_content['rich_text']:
-                if not isinstance(rt, dict):
-                    continue
-
-                if 'text' in rt:
-                    content = rt['text'].get('content', '')
-                    sanitized_content = cls.sanitize_text(content)
-
-                    sanitized_rt = {
-                        'type': 'text',
-                        'text': {
-                            'content': sanitized_content
-                        }
-                    }
+        result = [None]
+        stack = [(block, depth, result, 0)]
 
-                    # Preserve link if valid
-                    if 'link' in rt['text'] and rt['text']['link']:
-                        link_url = rt['text']['link'].get('url', '')
-                        is_valid, _ = URLValidator.validate_url(link_url)
-                        if is_valid:
-                            sanitized_rt['text']['link'] = {'url': link_url}
+        while stack:
+            block, depth, slots, index = stack.pop()
 
-                    sanitized_rich_text.append(sanitized_rt)
+            if block is None:
+                # Every child below this entry is done; attach the new list
+                depth['children'] = slots
+                continue
 
-            type_content['rich_text'] = sanitized_rich_text
+            if depth > cls.MAX_NESTING_DEPTH:
+                raise ValueError(f"Nesting depth exceeds maximum ({cls.MAX_NESTING_DEPTH})")
 
-        # Handle nested blocks (children)
-        if 'children' in type_content:
-            sanitized_children = []
-            for child in type_content['children']:
-                sanitized_child = cls._sanitize_block(child, depth + 1)
-                sanitized_children.append(sanitized_child)
-            type_content['children'] = sanitized_children
+            block_type = block['type']
+            type_content = block[block_type]
+
+            # Sanitize rich text
+            if 'rich_text' in type_content:
+                type_content['rich_text'] = cls._sanitize_rich_text(type_content['rich_text'], url_validity)
+
+            # Queue nested blocks (children), first child on top
+            if 'children' in type_content:
+                children = type_content['children']
+                if inplace:
+                    sanitized_children = children
+                else:
+                    sanitized_children = [None] * len(children)
+                    stack.append((None, type_content, sanitized_children, None))
+                for i in range(len(children) - 1, -1, -1):
+                    stack.append((children[i], depth + 1, sanitized_children, i))
+
+            if inplace:
+                for key in [k for k in block if k != 'type' and k != block_type]:
+                    del block[key]
+                block['object'] = 'block'
+                slots[index] = block
+            else:
+                slots[index] = {
+                    'object': 'block',
+                    'type': block_type,
+                    block_type: type_content
+                }
+
+        return result[0]
 
-        sanitized[block_type] = type_content
-        return sanitized
+    @classmethod
+    def _sanitize_rich_text(
+        cls,
+        rich_text: List[Dict],
+        url_validity: Optional[Dict[str, bool]] = None
+    ) -> List[Dict]:
+        """Sanitize rich text spans, keeping only links that pass validation."""
+        sanitized_rich_text = []
+
+        for rt in rich_text:
+            # Spans are almost always well-formed text dicts; anything else
+            # (non-dicts, non-text spans) is skipped via the exception path
+            try:
+                text = rt['text']
+                content = text.get('content', '')
+                link = text.get('link')
+            except (KeyError, TypeError, AttributeError):
+                continue
+
+            sanitized_rt = {
+                'type': 'text',
+                'text': {
+                    'content': cls.sanitize_text(content)
+                }
+            }
+
+            # Preserve link if valid
+            if link:
+                link_url = link.get('url', '')
+                if url_validity is not None and isinstance(link_url, str):
+                    is_valid = url_validity.get(link_url)
+                else:
+                    is_valid = None
+                if is_valid is None:
+                    is_valid, _ = URLValidator.validate_url(link_url)
+                if is_valid:
+                    sanitized_rt['text']['link'] = {'url': link_url}
+
+            sanitized_rich_text.append(sanitized_rt)
+
+        return sanitized_rich_text
 
 
 class CommandValidator:
@@ -344,6 +607,22 @@ class CommandValidator:
     # Characters not allowed in safe inputs
     DANGEROUS_CHARS = [';', '&', '|', '$', '`', '\n', '\r', '(', ')', '<', '>']
 
+    # Multi-character patterns not allowed in safe inputs
+    SUSPICIOUS_PATTERNS = [
+        '..',      # Path traversal
+        '/etc/',   # System directories
+        '/proc/',  # Process information
+        '~/',      # Home expansion
+        '${',      # Variable expansion
+        '$(',      # Command substitution
+    ]
+
+    # Deletion table for sanitize_argument
+    _DANGEROUS_TRANSLATE = str.maketrans('', '', ''.join(DANGEROUS_CHARS))
+
+    # Any dangerous character or suspicious pattern, in a single scan
+    _UNSAFE_RE = re.compile('|'.join(map(re.escape, DANGEROUS_CHARS + SUSPICIOUS_PATTERNS)))
+
     @classmethod
     def is_safe_argument(cls, arg: str) -> bool:
         """
@@ -358,26 +637,8 @@ class CommandValidator:
         if not isinstance(arg, str):
             return False
 
-        # Check for dangerous characters
-        for char in cls.DANGEROUS_CHARS:
-            if char in arg:
-                return False
-
-        # Check for suspicious patterns
-        suspicious_patterns = [
-            '..',      # Path traversal
-            '/etc/',   # System directories
-            '/proc/',  # Process information
-            '~/',      # Home expansion
-            '${',      # Variable expansion
-            '$(',      # Command substitution
-        ]
-
-        for pattern in suspicious_patterns:
-            if pattern in arg:
-                return False
-
-        return True
+        # Check for dangerous characters and suspicious patterns
+        return cls._UNSAFE_RE.search(arg) is None
 
     @classmethod
     def sanitize_argument(cls, arg: str) -> str:
@@ -391,13 +652,10 @@ class CommandValidator:
             Sanitized argument
         """
         # Remove dangerous characters
-        for char in cls.DANGEROUS_CHARS:
-            arg = arg.replace(char, '')
-
-        return arg.strip()
+        return arg.translate(cls._DANGEROUS_TRANSLATE).strip()
 
     @classmethod
-    def validate_path(cls, path: str) -> tuple[bool, str]:
+    def validate_path(cls, path: str) -> Tuple[bool, str]:
         """
         Validate file path for safety.
 
@@ -407,23 +665,20 @@ class CommandValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        from pathlib import Path
-
         try:
-            path_obj = Path(path).resolve()
-
-            # Check for path traversal
+            # Check for path traversal (before touching the filesystem)
             if '..' in path:
                 return False, "Path traversal detected"
 
+            path_obj = Path(path).resolve()
+
             # Check if path is absolute
             if not path_obj.is_absolute():
                 return False, "Path must be absolute"
 
             # Ensure path is within allowed directories
-            home = Path.home()
             try:
-                path_obj.relative_to(home)
+                path_obj.relative_to(_HOME)
                 return True, ""
             except ValueError:
                 return False, "Path must be within user home directory"
@@ -437,13 +692,23 @@ class InputValidator:
     Main validator class coordinating all validation types.
     """
 
+    # Content fields copied to Notion unchanged
+    PASSTHROUGH_FIELDS = frozenset({'timestamp', 'related_questions'})
+
     def __init__(self):
         """Initialize validator."""
         self.url_validator = URLValidator()
         self.content_sanitizer = ContentSanitizer()
         self.command_validator = CommandValidator()
 
-    def validate_perplexity_url(self, url: str) -> tuple[bool, str]:
+        # Content field -> sanitizer for sanitize_notion_content
+        self._field_sanitizers = {
+            'title': self.content_sanitizer.sanitize_title,
+            'content': self.content_sanitizer.sanitize_text,
+            'sources': self._sanitize_sources,
+        }
+
+    def validate_perplexity_url(self, url: str) -> Tuple[bool, str]:
         """
         Validate Perplexity URL.
 
@@ -453,14 +718,20 @@ class InputValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        # URL format validation
-        is_valid, error = self.url_validator.validate_url(url)
+        # Cheap prefix pre-filter before any parsing
+        validator = self.url_validator
+        if url and isinstance(url, str):
+            head = url.lstrip()[:validator._PREFIX_SCAN_LEN].lower()
+            if not head.startswith(validator.ALLOWED_PREFIXES):
+                return False, f"URL must start with one of: {', '.join(validator.ALLOWED_PREFIXES)}"
+
+        # URL format validation (parses once; hostname reused below)
+        is_valid, error, hostname = self.url_validator._validate_url_host(url)
         if not is_valid:
             return False, error
 
         # DNS resolution check (prevent DNS rebinding)
-        parsed = urlparse(url)
-        is_valid, error = self.url_validator.resolve_and_validate_ip(parsed.hostname)
+        is_valid, error = self.url_validator.resolve_and_validate_ip(hostname)
         if not is_valid:
             return False, error
 
@@ -469,7 +740,7 @@ class InputValidator:
     def sanitize_notion_content(
         self,
         content: Dict[str, Any]
-    ) -> tuple[bool, str, Dict[str, Any]]:
+    ) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Sanitize content before sending to Notion.
 
@@ -480,41 +751,37 @@ class InputValidator:
             Tuple of (is_valid, error_message, sanitized_content)
         """
         sanitized = {}
+        field_sanitizers = self._field_sanitizers
 
-        # Sanitize title
-        if 'title' in content:
-            sanitized['title'] = self.content_sanitizer.sanitize_title(content['title'])
-
-        # Sanitize main content
-        if 'content' in content:
-            sanitized['content'] = self.content_sanitizer.sanitize_text(content['content'])
-
-        # Validate and sanitize sources
-        if 'sources' in content:
-            sanitized_sources = []
-            for source in content['sources']:
-                if isinstance(source, dict):
-                    url = source.get('url', '')
-                    is_valid, _ = self.url_validator.validate_url(url)
-                    if is_valid:
-                        sanitized_sources.append({
-                            'title': self.content_sanitizer.sanitize_text(source.get('title', '')),
-                            'url': url
-                        })
-                elif isinstance(source, str):
-                    is_valid, _ = self.url_validator.validate_url(source)
-                    if is_valid:
-                        sanitized_sources.append(source)
-
-            sanitized['sources'] = sanitized_sources
-
-        # Copy other safe fields
-        for key in ['timestamp', 'related_questions']:
-            if key in content:
-                sanitized[key] = content[key]
+        for key, value in content.items():
+            sanitizer = field_sanitizers.get(key)
+            if sanitizer is not None:
+                sanitized[key] = sanitizer(value)
+            elif key in self.PASSTHROUGH_FIELDS:
+                # Copy other safe fields
+                sanitized[key] = value
 
         return True, "", sanitized
 
+    def _sanitize_sources(self, sources: List) -> List:
+        """Keep sources with valid URLs, as dicts with sanitized titles or bare URLs."""
+        sanitized_sources = []
+        for source in sources:
+            if isinstance(source, dict):
+                url = source.get('url', '')
+                is_valid, _ = self.url_validator.validate_url(url)
+                if is_valid:
+                    sanitized_sources.append({
+                        'title': self.content_sanitizer.sanitize_text(source.get('title', '')),
+                        'url': url
+                    })
+            elif isinstance(source, str):
+                is_valid, _ = self.url_validator.validate_url(source)
+                if is_valid:
+                    sanitized_sources.append(source)
+
+        return sanitized_sources
+
 
 # Testing
 if __name__ == '__main__':
@@ -19,22 +19,94 @@ License: MIT
 """
 
 import base64
+import ctypes
+import functools
 import hashlib
 import json
 import os
 import subprocess
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# cryptography dominates this module's import time and is only needed once
+# credentials are actually encrypted or decrypted; _load_cryptography()
+# binds these on first use
+AESGCM = InvalidTag = Fernet = None
+
+
+def _load_cryptography():
+    """Import the cryptography primitives used here, once."""
+    global AESGCM, InvalidTag, Fernet
+    if AESGCM is not None:
+        return
+
+    try:
+        from cryptography.exceptions import InvalidTag
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        print("⚠️  Cryptography module missing. Install with:")
+        print("pip install cryptography")
+        raise
+
+
+# Derived ciphers keyed by (kind, salt, device_id), so each key is derived
+# once per process rather than on every AndroidSecureStorage construction
+_KEY_CACHE: Dict[Tuple[str, bytes, str], Any] = {}
+
+# Credential files are nonce || AES-256-GCM ciphertext
+_NONCE_SIZE = 12
+
+# scrypt cost for the credential key (~32 MiB, derived once per process).
+# The device ID it stretches is built from guessable host details when the
+# serial number is unreadable, so the derivation has to stay slow.
+_SCRYPT_N = 2 ** 15
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_MAXMEM = 64 * 1024 * 1024
+
+# Bionic's PROP_VALUE_MAX (value buffer size, including the NUL)
+_PROP_VALUE_MAX = 92
+
+
+@functools.lru_cache(maxsize=None)
+def _system_property_get():
+    """Resolve bionic's __system_property_get, or None off Android."""
+    try:
+        func = ctypes.CDLL('libc.so').__system_property_get
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = (ctypes.c_char_p, ctypes.c_char_p)
+    func.restype = ctypes.c_int
+    return func
+
+
+def _getprop(name: str) -> Optional[str]:
+    """
+    Read an Android system property.
+
+    Calls libc directly when possible, avoiding a getprop fork/exec per
+    lookup; falls back to the getprop binary otherwise.
 
-try:
-    from cryptography.fernet import Fernet
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
-    from cryptography.hazmat.backends import default_backend
-except ImportError:
-    print("⚠️  Cryptography module missing. Install with:")
-    print("pip install cryptography")
-    raise
+    Returns:
+        Property value (empty if unset), or None if properties can't be read
+    """
+    func = _system_property_get()
+    if func is not None:
+        buf = ctypes.create_string_buffer(_PROP_VALUE_MAX)
+        func(name.encode(), buf)
+        return buf.value.decode(errors='replace').strip()
+
+    try:
+        result = subprocess.run(
+            ['getprop', name],
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
 
 
 class AndroidSecureStorage:
@@ -47,6 +119,9 @@ class AndroidSecureStorage:
     3. Encrypted file with restricted permissions
     """
 
+    # Device IDs already looked up this process, keyed by is_android
+    _device_ids: Dict[bool, str] = {}
+
     def __init__(self, storage_dir: Optional[Path] = None, use_biometric: bool = False):
         """
         Initialize secure storage.
@@ -62,11 +137,18 @@ class AndroidSecureStorage:
         self.salt_file = self.storage_dir / '.salt'
         self.use_biometric = use_biometric
 
+        # Last decrypted credentials and a digest of the ciphertext they
+        # came from; reused while the file holds the same bytes
+        self._cache: Optional[Dict[str, str]] = None
+        self._cache_token: Optional[bytes] = None
+
         # Check if running on Android/Termux
         self.is_android = self._check_android_environment()
 
-        # Initialize encryption
-        self._init_encryption()
+    @functools.cached_property
+    def aead(self) -> 'AESGCM':
+        """Credential cipher, initialized on first use."""
+        return self._init_encryption()
 
     def _check_android_environment(self) -> bool:
         """Check if running on Android/Termux."""
@@ -75,20 +157,18 @@ class AndroidSecureStorage:
             return True
 
         # Check for Android system properties
-        try:
-            result = subprocess.run(
-                ['getprop', 'ro.build.version.release'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return _getprop('ro.build.version.release') is not None
 
     def _get_device_id(self) -> str:
+        """Get unique device identifier (looked up once per process)."""
+        device_id = self._device_ids.get(self.is_android)
+        if device_id is None:
+            device_id = self._device_ids[self.is_android] = self._read_device_id()
+        return device_id
+
+    def _read_device_id(self) -> str:
         """
-        Get unique device identifier.
+        Read unique device identifier.
 
         Priority order:
         1. Android ID (via getprop)
@@ -96,18 +176,10 @@ class AndroidSecureStorage:
         3. System UUID fallback
         """
         if self.is_android:
-            try:
-                # Try to get Android ID
-                result = subprocess.run(
-                    ['getprop', 'ro.serialno'],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return hashlib.sha256(result.stdout.strip().encode()).hexdigest()
-            except:
-                pass
+            # Try to get Android ID
+            serial = _getprop('ro.serialno')
+            if serial:
+                return hashlib.sha256(serial.encode()).hexdigest()
 
         # Fallback: use machine-specific identifiers
         import platform
@@ -123,8 +195,14 @@ class AndroidSecureStorage:
         combined = '|'.join(identifiers)
         return hashlib.sha256(combined.encode()).hexdigest()
 
-    def _init_encryption(self):
-        """Initialize encryption key from device ID."""
+    def _init_encryption(self) -> 'AESGCM':
+        """
+        Initialize encryption key from device ID.
+
+        Hashing the device ID adds no entropy, and without a readable serial
+        number it comes from guessable host details, so the key is stretched
+        with scrypt. The result is cached per process (see _KEY_CACHE).
+        """
         # Get or create salt
         if self.salt_file.exists():
             salt = self.salt_file.read_bytes()
@@ -134,18 +212,52 @@ class AndroidSecureStorage:
             self.salt_file.chmod(0o600)
 
         # Derive encryption key from device ID
-        device_id = self._get_device_id()
-
-        kdf = PBKDF2(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
+        self._salt = salt
+        self._device_id = self._get_device_id()
+        return self._derive_cipher('aesgcm')
 
-        key = base64.urlsafe_b64encode(kdf.derive(device_id.encode()))
-        self.fernet = Fernet(key)
+    def _derive_cipher(self, kind: str):
+        """
+        Derive (or reuse) a cipher for this salt/device ID.
+
+        Args:
+            kind: 'aesgcm' (current format, scrypt key) or 'fernet-pbkdf2'
+                (files written by older versions)
+        """
+        cache_key = (kind, self._salt, self._device_id)
+        cipher = _KEY_CACHE.get(cache_key)
+        if cipher is not None:
+            return cipher
+
+        _load_cryptography()
+        secret = self._device_id.encode()
+        if kind == 'aesgcm':
+            raw_key = hashlib.scrypt(
+                secret,
+                salt=self._salt,
+                n=_SCRYPT_N,
+                r=_SCRYPT_R,
+                p=_SCRYPT_P,
+                maxmem=_SCRYPT_MAXMEM,
+                dklen=32
+            )
+            cipher = AESGCM(raw_key)
+        else:
+            # Original key derivation. hashlib runs the whole loop in
+            # OpenSSL's PKCS5_PBKDF2_HMAC.
+            raw_key = hashlib.pbkdf2_hmac('sha256', secret, self._salt, 100000, dklen=32)
+            cipher = Fernet(base64.urlsafe_b64encode(raw_key))
+        _KEY_CACHE[cache_key] = cipher
+        return cipher
+
+    def _seal(self, data: bytes) -> bytes:
+        """Encrypt data in the credential file format."""
+        nonce = os.urandom(_NONCE_SIZE)
+        return nonce + self.aead.encrypt(nonce, data, None)
+
+    def _open_legacy(self, blob: bytes) -> bytes:
+        """Decrypt a credential file written by an older version of this module."""
+        return self._derive_cipher('fernet-pbkdf2').decrypt(blob)
 
     def _verify_biometric(self) -> bool:
         """
@@ -214,11 +326,12 @@ class AndroidSecureStorage:
             data = json.dumps(credentials).encode()
 
             # Encrypt
-            encrypted = self.fernet.encrypt(data)
+            encrypted = self._seal(data)
 
             # Save with restricted permissions
             self.credential_file.write_bytes(encrypted)
             self.credential_file.chmod(0o600)  # Owner read/write only
+            self._remember(credentials, encrypted)
 
             print("✓ Credentials saved securely")
             return True
@@ -246,11 +359,26 @@ class AndroidSecureStorage:
             # Read encrypted data
             encrypted = self.credential_file.read_bytes()
 
+            # Skip decryption if the file hasn't changed since last time.
+            # Compared by content: timestamps on Termux's FUSE/SD-card storage
+            # are too coarse to catch a same-size rewrite.
+            if self._cache is not None and self._cache_token == self._digest(encrypted):
+                return dict(self._cache)
+
             # Decrypt
-            data = self.fernet.decrypt(encrypted)
+            aead = self.aead
+            try:
+                data = aead.decrypt(encrypted[:_NONCE_SIZE], encrypted[_NONCE_SIZE:], None)
+            except InvalidTag:
+                # Written by an older version: read it with the key that
+                # wrote it once and re-encrypt under the current one
+                data = self._open_legacy(encrypted)
+                encrypted = self._seal(data)
+                self.credential_file.write_bytes(encrypted)
 
             # Deserialize
             credentials = json.loads(data.decode())
+            self._remember(credentials, encrypted)
 
             return credentials
 
@@ -258,15 +386,41 @@ class AndroidSecureStorage:
             print(f"❌ Failed to load credentials: {e}")
             return None
 
+    @staticmethod
+    def _digest(encrypted: bytes) -> bytes:
+        """Change marker for credential file contents."""
+        return hashlib.blake2b(encrypted, digest_size=16).digest()
+
+    def _remember(self, credentials: Dict[str, str], encrypted: bytes):
+        """Cache credentials as the decryption of the given file contents."""
+        self._cache = dict(credentials)
+        self._cache_token = self._digest(encrypted)
+
     def delete_credentials(self):
-        """Securely delete credentials."""
+        """
+        Delete credentials (best effort).
+
+        The credential and salt files are unlinked, not overwritten: on the
+        flash storage Android uses, the FTL remaps in-place writes, so an
+        overwrite gives no guarantee either way. Their old blocks may stay
+        recoverable until the storage reuses them. Dropping the salt means
+        later saves are encrypted under a fresh key.
+        """
         if self.credential_file.exists():
-            # Overwrite with random data before deletion
-            size = self.credential_file.stat().st_size
-            self.credential_file.write_bytes(os.urandom(size))
             self.credential_file.unlink()
+            self._cache = self._cache_token = None
 
-            print("✓ Credentials deleted securely")
+            if self.salt_file.exists():
+                salt = self.salt_file.read_bytes()
+                self.salt_file.unlink()
+
+                # Forget keys derived from the discarded salt; a new one is
+                # created on next use
+                for cache_key in [k for k in _KEY_CACHE if k[1] == salt]:
+                    del _KEY_CACHE[cache_key]
+                self.__dict__.pop('aead', None)
+
+            print("✓ Credentials deleted")
 
     def migrate_from_env(self, env_file: Path) -> bool:
         """
@@ -286,14 +440,15 @@ class AndroidSecureStorage:
 
         # Parse .env file
         credentials = {}
-        for line in env_file.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+        with env_file.open('r', encoding='utf-8', buffering=65536) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line[0] == '#':
+                    continue
 
-            if '=' in line:
-                key, value = line.split('=', 1)
-                credentials[key.strip()] = value.strip()
+                key, sep, value = line.partition('=')
+                if sep:
+                    credentials[key.strip()] = value.strip()
 
         if not credentials:
             print("⚠️  No credentials found in .env file")
@@ -334,19 +489,8 @@ class KnoxSecureStorage:
         if not os.environ.get('TERMUX_VERSION'):
             return False
 
-        try:
-            # Check for Knox system properties
-            result = subprocess.run(
-                ['getprop', 'ro.config.knox'],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-
-            return result.returncode == 0 and result.stdout.strip()
-
-        except:
-            return False
+        # Check for Knox system properties
+        return bool(_getprop('ro.config.knox'))
 
     def store_in_knox_vault(self, key: str, value: str) -> bool:
         """
@@ -14,6 +14,7 @@ Features:
 - Authentication via API key
 - Push notification support
 - Request logging and monitoring
+- Concurrent request handling (one thread per request)
 - Mobile-optimized responses
 
 Author: Claude Code
@@ -23,7 +24,7 @@ License: MIT
 import json
 import logging
 import threading
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
 from typing import Any, Dict, Optional
 import traceback
@@ -39,6 +40,7 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
     # Set by run_webhook_server()
     app = None
+    batcher = None
     api_key = None
     logger = None
 
@@ -152,19 +154,27 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 )
                 return
 
+            source = payload.get('source')
+            if source is not None and not (isinstance(source, str) and source):
+                self._send_json_response(
+                    {
+                        'error': 'Invalid field',
+                        'message': '"source" must be a non-empty string'
+                    },
+                    400
+                )
+                return
+
             # Process export
-            self.logger.info(f"📥 Webhook request received from {self.client_address[0]}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"📥 Webhook request received from {self.client_address[0]}")
 
             if payload.get('content'):
                 # Manual content provided
                 perplexity_content = payload['content']
             else:
-                # Fetch from source
-                source = payload['source']
-                if source.startswith('http'):
-                    perplexity_content = self.app.perplexity.fetch_thread_content(source)
-                else:
-                    perplexity_content = self.app.perplexity.search(source)
+                # Fetch from source (coalesced with concurrent requests)
+                perplexity_content = self.batcher.fetch(source)
 
             if not perplexity_content:
                 self._send_json_response(
@@ -173,16 +183,18 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 )
                 return
 
-            # Determine destination
+            # Determine destination, falling back to the saved default
             destination_id = payload.get('destination_id')
-            destination_type = payload.get('destination_type', 'database')
-
-            if not destination_id:
-                # Use saved default
-                destination_id = self.app.preferences.get('default_destination_id')
-                destination_type = self.app.preferences.get('default_destination_type', 'database')
+            if destination_id:
+                destination = {
+                    'id': destination_id,
+                    'type': payload.get('destination_type', 'database'),
+                    'name': 'Webhook Destination'
+                }
+            else:
+                destination = self.app.saved_destination()
 
-            if not destination_id:
+            if not destination:
                 self._send_json_response(
                     {
                         'error': 'No destination',
@@ -192,16 +204,18 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 )
                 return
 
-            destination = {
-                'id': destination_id,
-                'type': destination_type,
-                'name': 'Webhook Destination'
-            }
-
             # Export to Notion
-            success = self.app._export_to_notion(perplexity_content, destination)
+            success = self.app._export_to_notion(
+                perplexity_content, destination, source
+            )
 
-            if success:
+            if success == self.app.EXPORT_SKIPPED:
+                self._send_json_response({
+                    'status': 'skipped',
+                    'message': 'Content was already exported to this destination',
+                    'title': perplexity_content.get('title', 'Untitled')
+                })
+            elif success:
                 self._send_json_response({
                     'status': 'success',
                     'message': 'Content exported to Notion successfully',
@@ -231,7 +245,9 @@ class WebhookHandler(BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         """Override to use custom logger."""
         if self.logger:
-            self.logger.info(f"{self.client_address[0]} - {format % args}")
+            # Access logging runs per request; skip formatting when filtered
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"{self.client_address[0]} - {format % args}")
 
 
 def run_webhook_server(app, port: int, logger: logging.Logger, api_key: Optional[str] = None):
@@ -244,31 +260,39 @@ def run_webhook_server(app, port: int, logger: logging.Logger, api_key: Optional
         logger: Logger instance
         api_key: Optional API key for authentication
     """
-    # Configure handler with app instance
+    # Configure handler with app instance. The app creates its API clients
+    # lazily; build them here so handler threads never race to do it
+    app.notion
     WebhookHandler.app = app
+    WebhookHandler.batcher = app.batcher
     WebhookHandler.logger = logger
     WebhookHandler.api_key = api_key or app.config.config_dir / 'webhook_key.txt'
 
-    # Create server
+    # Create server; each request gets its own thread so slow Perplexity
+    # and Notion round-trips don't block other clients, and concurrent
+    # fetches can be coalesced by the batcher
     server_address = ('', port)
-    httpd = HTTPServer(server_address, WebhookHandler)
-
-    logger.info("=" * 60)
-    logger.info("🌐 Webhook Server Started")
-    logger.info("=" * 60)
-    logger.info(f"Listening on: http://0.0.0.0:{port}")
-    logger.info(f"Local access: http://localhost:{port}")
-    logger.info("\nEndpoints:")
-    logger.info(f"  POST http://localhost:{port}/export  - Export content")
-    logger.info(f"  GET  http://localhost:{port}/health  - Health check")
-    logger.info(f"  GET  http://localhost:{port}/        - API info")
-    logger.info("\nPress Ctrl+C to stop")
-    logger.info("=" * 60)
+    httpd = ThreadingHTTPServer(server_address, WebhookHandler)
+
+    # Startup banner goes to stdout so it shows at any log level
+    print(
+        f"{'=' * 60}\n"
+        "🌐 Webhook Server Started\n"
+        f"{'=' * 60}\n"
+        f"Listening on: http://0.0.0.0:{port}\n"
+        f"Local access: http://localhost:{port}\n"
+        "\nEndpoints:\n"
+        f"  POST http://localhost:{port}/export  - Export content\n"
+        f"  GET  http://localhost:{port}/health  - Health check\n"
+        f"  GET  http://localhost:{port}/        - API info\n"
+        "\nPress Ctrl+C to stop\n"
+        f"{'=' * 60}"
+    )
 
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
-        logger.info("\n\n👋 Shutting down webhook server...")
+        print("\n\n👋 Shutting down webhook server...")
         httpd.shutdown()
 
 